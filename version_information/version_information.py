@@ -43,58 +43,127 @@ Usage
    ``<module>.__version__``.
 
    If ``<module>.__version__`` is not set, it attempts to get a version
-   string with ``pkg_resources.require('<module>')[0].version``
-   (the ``version`` field from ``setup.py``).
+   string with ``importlib.metadata.version('<module>')``
+   (the ``version`` field from ``setup.py``), falling back to
+   ``pkg_resources.require('<module>')[0].version`` on Python < 3.8.
 
 """
+import functools
 import html
+import importlib
 import json
-import subprocess
+import re
 import sys
 import time
-import locale
-import IPython
-import platform
+from IPython import version_info as _ipython_version_info
 from IPython.core.magic import magics_class, line_magic, Magics
 
-try:
-    import pkg_resources
-except ImportError:
-    pkg_resources = None
-
 timefmt = '%a %b %d %H:%M:%S %Y %Z'
 
-
-def _date_format_encoding():
-    return locale.getlocale(locale.LC_TIME)[1] or locale.getpreferredencoding()
+# IPython >= 3 takes the JSON repr as a Python object rather than a string
+_IPYTHON_JSON_OBJECT = _ipython_version_info[0] >= 3
+
+_LATEX_ESCAPE_CHARS = {
+    '&':  r'\&',
+    '%':  r'\%',
+    '$':  r'\$',
+    '#':  r'\#',
+    '_':  r'\_',
+    '{':  r'\letteropenbrace{}',
+    '}':  r'\letterclosebrace{}',
+    '~':  r'\lettertilde{}',
+    '^':  r'\letterhat{}',
+    '\\': r'\letterbackslash{}',
+    '>':  r'\textgreater',
+    '<':  r'\textless',
+}
+
+_LATEX_TRANS = str.maketrans(_LATEX_ESCAPE_CHARS)
+
+# match any character that needs escaping, so clean strings skip translate
+_LATEX_SPECIAL_RE = re.compile(
+    "[%s]" % re.escape("".join(_LATEX_ESCAPE_CHARS)))
+
+# the html table cells use the same escaping as the latex table
+_HTML_ESCAPE_CHARS = _LATEX_ESCAPE_CHARS
+_HTML_TRANS = _LATEX_TRANS
+_HTML_SPECIAL_RE = _LATEX_SPECIAL_RE
+
+# per-package row templates for the html, latex and plaintext reprs
+_HTML_ROW = "<tr><td>%s</td><td>%s</td></tr>"
+_LATEX_ROW = r"%s & %s \\ \hline"
+_PRETTY_ROW = "%s %s\n"
+
+
+@functools.lru_cache(maxsize=1)
+def _static_header():
+    import platform
+    import IPython
+
+    return (
+        ("Python", "{version} {arch} [{compiler}]".format(
+            version=platform.python_version(),
+            arch=platform.architecture()[0],
+            compiler=platform.python_compiler())),
+        ("IPython", IPython.__version__),
+        ("OS", platform.platform().replace('-', ' ')),
+        )
+
+
+def _non_python_package_version(package):
+    import shutil
+    import subprocess
+    # resolve through PATH (and PATHEXT on Windows) so .bat/.cmd shims
+    # such as conda.bat are found without going through a shell
+    command = shutil.which(package) or package
+    try:
+        result = subprocess.run([command, "--version"],
+                                stdout=subprocess.PIPE,
+                                stderr=subprocess.STDOUT,
+                                universal_newlines=True,
+                                timeout=2.0).stdout
+        if result.endswith("\n"):
+            result = result[:-1]
+    except subprocess.TimeoutExpired as e:
+        result = "Timed out after %s seconds" % e.timeout
+    except OSError as e:
+        result = "Package not found " + str(e)
+    except Exception as e:
+        result = str(e)
+    return result
 
 
 @magics_class
 class VersionInformation(Magics):
     
-    def get_non_python_package_version(self, package):
-        try:
-            result = subprocess.getoutput(package  + " --version")
-        except Exception as e:
-            result = "Package not found " + str(e)
-        self.packages.append((package, result))
+    def get_non_python_package_version(self, package, version=None):
+        if version is None:
+            version = _non_python_package_version(package)
+        self.packages.append((package, version))
+        self._json_obj = None
 
         
     def get_module_version(self, module):
         try:
-            code = ("import %s; version=str(%s.__version__)" %
-                    (module, module))
-            ns_g = ns_l = {}
-            exec(compile(code, "<string>", "exec"), ns_g, ns_l)
-            self.packages.append((module, ns_l["version"]))
+            mod = sys.modules.get(module) or importlib.import_module(module)
+            version = getattr(mod, '__version__', None)
+            if version is None:
+                raise AttributeError(
+                    "module %r has no attribute '__version__'" % module)
+            self.packages.append((module, str(version)))
         except Exception as e:
             try:
-                if pkg_resources is None:
-                    raise
-                version = pkg_resources.require(module)[0].version
+                try:
+                    from importlib.metadata import version as _pkg_version
+                except ImportError:
+                    import pkg_resources
+                    version = pkg_resources.require(module)[0].version
+                else:
+                    version = _pkg_version(module)
                 self.packages.append((module, version))
             except Exception as e:
                 self.packages.append((module, str(e)))
+        self._json_obj = None
 
 
 
@@ -107,121 +176,92 @@ class VersionInformation(Magics):
             %version_information [optional comma-separated list of modules]
 
         """
-        self.packages = [
-            ("Python", "{version} {arch} [{compiler}]".format(
-                version=platform.python_version(),
-                arch=platform.architecture()[0],
-                compiler=platform.python_compiler())),
-            ("IPython", IPython.__version__),
-            ("OS", platform.platform().replace('-', ' '))
-            ]
-
-        modules = line.replace(' ', '').split(",")
+        self.packages = list(_static_header())
+        self._json_obj = None
+
+        # drop empty entries and duplicates, keeping the order given
+        modules = list(dict.fromkeys(
+            module for module in line.replace(' ', '').split(",") if module))
+
+        # run the external "--version" probes concurrently, since each one
+        # is a separate process launch
+        non_python = [module[1:] for module in modules if module.startswith('!')]
+        non_python_versions = {}
+        if non_python:
+            from concurrent.futures import ThreadPoolExecutor
+            with ThreadPoolExecutor(max_workers=min(8, len(non_python))) as ex:
+                non_python_versions = dict(zip(
+                    non_python, ex.map(_non_python_package_version, non_python)))
 
         for module in modules:
-            if len(module) > 0:
-                if(module.startswith('!')):
-                    self.get_non_python_package_version(module[1:])
-                else:
-                    self.get_module_version(module)
-                
+            if(module.startswith('!')):
+                self.get_non_python_package_version(
+                    module[1:], non_python_versions[module[1:]])
+            else:
+                self.get_module_version(module)
+
+        self._timestamp = time.strftime(timefmt)
+
         return self
 
     def _repr_json_(self):
-        obj = {
-            'Software versions': [
-                {'module': name, 'version': version} for
-                (name, version) in self.packages]}
-        if IPython.version_info[0] >= 3:
-            return obj
+        # built on first use and reset whenever self.packages is extended
+        if self._json_obj is None:
+            self._json_obj = {
+                'Software versions': [
+                    {'module': name, 'version': version} for
+                    (name, version) in self.packages]}
+        if _IPYTHON_JSON_OBJECT:
+            return self._json_obj
         else:
-            return json.dumps(obj)
+            return json.dumps(self._json_obj)
 
     @staticmethod
     def _htmltable_escape(str_):
-        CHARS = {
-            '&':  r'\&',
-            '%':  r'\%',
-            '$':  r'\$',
-            '#':  r'\#',
-            '_':  r'\_',
-            '{':  r'\letteropenbrace{}',
-            '}':  r'\letterclosebrace{}',
-            '~':  r'\lettertilde{}',
-            '^':  r'\letterhat{}',
-            '\\': r'\letterbackslash{}',
-            '>':  r'\textgreater',
-            '<':  r'\textless',
-        }
-        return u"".join([CHARS.get(c, c) for c in str_])
+        if _HTML_SPECIAL_RE.search(str_) is None:
+            return str_
+        return str_.translate(_HTML_TRANS)
 
     def _repr_html_(self):
 
-        html_table = "<table>"
-        html_table += "<tr><th>Software</th><th>Version</th></tr>"
+        parts = ["<table><tr><th>Software</th><th>Version</th></tr>"]
         for name, version in self.packages:
             _version = self._htmltable_escape(version)
-            html_table += "<tr><td>%s</td><td>%s</td></tr>" % (name, _version)
+            parts.append(_HTML_ROW % (name, _version))
 
-        try:
-            html_table += "<tr><td colspan='2'>%s</td></tr>" % time.strftime(timefmt)
-        except:
-            html_table += "<tr><td colspan='2'>%s</td></tr>" % \
-                time.strftime(timefmt).decode(_date_format_encoding())
-        html_table += "</table>"
+        parts.append("<tr><td colspan='2'>%s</td></tr>" % self._timestamp)
+        parts.append("</table>")
 
-        return html_table
+        return "".join(parts)
 
     @staticmethod
     def _latex_escape(str_):
-        CHARS = {
-            '&':  r'\&',
-            '%':  r'\%',
-            '$':  r'\$',
-            '#':  r'\#',
-            '_':  r'\_',
-            '{':  r'\letteropenbrace{}',
-            '}':  r'\letterclosebrace{}',
-            '~':  r'\lettertilde{}',
-            '^':  r'\letterhat{}',
-            '\\': r'\letterbackslash{}',
-            '>':  r'\textgreater',
-            '<':  r'\textless',
-        }
-        return u"".join([CHARS.get(c, c) for c in str_])
+        if _LATEX_SPECIAL_RE.search(str_) is None:
+            return str_
+        return str_.translate(_LATEX_TRANS)
 
     def _repr_latex_(self):
 
-        latex = r"\begin{tabular}{|l|l|}\hline" + "\n"
-        latex += r"{\bf Software} & {\bf Version} \\ \hline\hline" + "\n"
-        for name, version in self.packages:
-            _version = self._latex_escape(version)
-            latex += r"%s & %s \\ \hline" % (name, _version) + "\n"
+        rows = [_LATEX_ROW % (name, self._latex_escape(version))
+                for name, version in self.packages]
 
-        try:
-            latex += r"\hline \multicolumn{2}{|l|}{%s} \\ \hline" % \
-                time.strftime(timefmt) + "\n"
-        except:
-            latex += r"\hline \multicolumn{2}{|l|}{%s} \\ \hline" % \
-                time.strftime(timefmt).decode(_date_format_encoding()) + "\n"
-
-        latex += r"\end{tabular}" + "\n"
-
-        return latex
+        return "\n".join([
+            r"\begin{tabular}{|l|l|}\hline",
+            r"{\bf Software} & {\bf Version} \\ \hline\hline",
+            *rows,
+            r"\hline \multicolumn{2}{|l|}{%s} \\ \hline" % self._timestamp,
+            r"\end{tabular}",
+            ""])
 
     def _repr_pretty_(self, pp, cycle):
 
-        text = "Software versions\n"
+        parts = ["Software versions\n"]
         for name, version in self.packages:
-            text += "%s %s\n" % (name, version)
+            parts.append(_PRETTY_ROW % (name, version))
 
-        try:
-            text += "%s" % time.strftime(timefmt)
-        except:
-            text += "%s" % \
-                time.strftime(timefmt).decode(_date_format_encoding())
+        parts.append(self._timestamp)
 
-        pp.text(text)
+        pp.text("".join(parts))
 
 
 def load_ipython_extension(ipython):